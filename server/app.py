@@ -3,7 +3,9 @@ from flask import Flask
 from models import init_db
 from routes.games import games_bp
 from routes.publishers import publishers_bp
+from routes.health import health_bp
 from utils.database import init_db
+from utils.warmup import init_warmup
 
 # Get the server directory path
 base_dir: str = os.path.abspath(os.path.dirname(__file__))
@@ -16,6 +18,11 @@ init_db(app)
 # Register blueprints
 app.register_blueprint(games_bp)
 app.register_blueprint(publishers_bp)
+app.register_blueprint(health_bp)
+
+# Precompute listing responses in the background once each process serving requests gets its first
+# request, so reloader parents and pre-fork masters never warm up; /api/ready reports when this has finished
+init_warmup(app)
 
 if __name__ == '__main__':
     app.run(debug=True, port=5100) # Port 5100 to avoid macOS conflicts
\ No newline at end of file
@@ -26,4 +26,8 @@ def init_db(app, testing: bool = False):
     
     # Create tables when initializing
     with app.app_context():
-        db.create_all()
\ No newline at end of file
+        db.create_all()
+        
+        # create_all skips existing tables, so add any indexes missing from older databases
+        for index in Game.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
\ No newline at end of file
@@ -23,10 +23,13 @@ class Category(BaseModel):
     def __repr__(self):
         return f'<Category {self.name}>'
         
-    def to_dict(self):
+    def to_dict(self, game_count=None):
+        # Use a precomputed game count when provided to avoid loading every game
+        if game_count is None:
+            game_count = len(self.games) if self.games else 0
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'game_count': len(self.games) if self.games else 0
+            'game_count': game_count
         }
\ No newline at end of file
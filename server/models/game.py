@@ -11,8 +11,9 @@ class Game(BaseModel):
     star_rating = db.Column(db.Float, nullable=True)
     
     # Foreign keys for one-to-many relationships
-    category_id = db.Column(db.Integer, db.ForeignKey('categories.id'), nullable=False)
-    publisher_id = db.Column(db.Integer, db.ForeignKey('publishers.id'), nullable=False)
+    # Indexed so per-publisher and per-category game lists avoid full table scans
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.id'), nullable=False, index=True)
+    publisher_id = db.Column(db.Integer, db.ForeignKey('publishers.id'), nullable=False, index=True)
     
     # One-to-many relationships (many games belong to one category/publisher)
     category = relationship("Category", back_populates="games")
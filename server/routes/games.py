@@ -1,11 +1,15 @@
 from flask import jsonify, Response, Blueprint, request
 from models import db, Game, Publisher, Category
-from sqlalchemy.orm import Query
-from typing import Optional
+from sqlalchemy.orm import Query, contains_eager
+from typing import Any, Optional
 
 # Create a Blueprint for games routes
 games_bp = Blueprint('games', __name__)
 
+# Page sizes for paginated game lists
+DEFAULT_PAGE_SIZE: int = 20
+MAX_PAGE_SIZE: int = 100
+
 def get_games_base_query() -> Query:
     return db.session.query(Game).join(
         Publisher, 
@@ -17,6 +21,34 @@ def get_games_base_query() -> Query:
         isouter=True
     )
 
+def get_games_page(games_query: Query) -> tuple[list[dict[str, Any]], Optional[int]]:
+    """Get one page of games ordered by ID, using the `after` and `limit` query string parameters
+    
+    Pages are keyset paginated: `after` is the last game ID from the previous page.
+    Returns the page of games and the `after` value for the next page, or None if this is the last page.
+    """
+    after: Optional[str] = request.args.get('after')
+    limit: Optional[str] = request.args.get('limit')
+    
+    # Fall back to the default page size if the limit is missing or invalid
+    page_size = DEFAULT_PAGE_SIZE
+    if limit and limit.isdigit() and int(limit) > 0:
+        page_size = min(int(limit), MAX_PAGE_SIZE)
+    
+    if after and after.isdigit():
+        games_query = games_query.filter(Game.id > int(after))
+    
+    # Populate publisher and category from the base query joins rather than lazy loading per game,
+    # and fetch one extra row to find out if there is another page
+    games_result = games_query.options(
+        contains_eager(Game.publisher),
+        contains_eager(Game.category)
+    ).order_by(Game.id).limit(page_size + 1).all()
+    
+    next_after = games_result[page_size - 1].id if len(games_result) > page_size else None
+    
+    return [game.to_dict() for game in games_result[:page_size]], next_after
+
 @games_bp.route('/api/games', methods=['GET'])
 def get_games() -> Response:
     # Get filter parameters from query string
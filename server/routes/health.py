@@ -0,0 +1,13 @@
+from flask import jsonify, Response, Blueprint, current_app
+from utils.warmup import is_ready
+
+# Create a Blueprint for health routes
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('/api/ready', methods=['GET'])
+def get_ready() -> tuple[Response, int] | Response:
+    """Report whether the app has finished warming up and is ready for traffic"""
+    if not is_ready(current_app):
+        return jsonify({"status": "warming up"}), 503
+
+    return jsonify({"status": "ready"})
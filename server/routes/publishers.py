@@ -1,19 +1,93 @@
 from flask import jsonify, Response, Blueprint
-from models import db, Publisher, Category
+from models import db, Game, Publisher, Category
+from routes.games import get_games_base_query, get_games_page
+from sqlalchemy import func
+from sqlalchemy.orm import InstrumentedAttribute, Query
+from typing import Any, Optional, Type
 
 # Create a Blueprint for publishers routes
 publishers_bp = Blueprint('publishers', __name__)
 
+def get_game_stats_query(
+    model: Type[Publisher] | Type[Category],
+    game_column: InstrumentedAttribute
+) -> Query:
+    """Query publishers or categories with the count and average star rating of their games
+    
+    Args:
+        model: The Publisher or Category model
+        game_column: The Game foreign key column referencing the model
+    """
+    # Aggregate with a join rather than loading each entity's games
+    return db.session.query(
+        model,
+        func.count(Game.id),
+        func.avg(Game.star_rating)
+    ).outerjoin(
+        Game,
+        game_column == model.id
+    ).group_by(model.id)
+
+def get_details_with_games(
+    model: Type[Publisher] | Type[Category],
+    game_column: InstrumentedAttribute,
+    id: int
+) -> Optional[dict[str, Any]]:
+    """Get a publisher or category with its game stats and a page of its games
+    
+    Args:
+        model: The Publisher or Category model
+        game_column: The Game foreign key column referencing the model
+        id: The ID of the publisher or category
+    """
+    # Load the entity and aggregate its games in one query using the foreign key index
+    result = get_game_stats_query(model, game_column).filter(model.id == id).first()
+    
+    if not result:
+        return None
+    
+    entity, game_count, average_star_rating = result
+    
+    details = entity.to_dict(game_count=game_count)
+    details['average_star_rating'] = round(average_star_rating, 2) if average_star_rating is not None else None
+    details['games'], details['next_after'] = get_games_page(
+        get_games_base_query().filter(game_column == id)
+    )
+    
+    return details
+
 @publishers_bp.route('/api/publishers', methods=['GET'])
 def get_publishers() -> Response:
     """Get all publishers with game count"""
-    publishers = db.session.query(Publisher).all()
-    publishers_list = [publisher.to_dict() for publisher in publishers]
+    publishers = get_game_stats_query(Publisher, Game.publisher_id).order_by(Publisher.id).all()
+    publishers_list = [publisher.to_dict(game_count=game_count) for publisher, game_count, _ in publishers]
     return jsonify(publishers_list)
 
+@publishers_bp.route('/api/publishers/<int:id>', methods=['GET'])
+def get_publisher(id: int) -> tuple[Response, int] | Response:
+    """Get a publisher with game stats and a paginated list of its games"""
+    publisher = get_details_with_games(Publisher, Game.publisher_id, id)
+    
+    # Return 404 if publisher not found
+    if not publisher:
+        return jsonify({"error": "Publisher not found"}), 404
+    
+    return jsonify(publisher)
+
 @publishers_bp.route('/api/categories', methods=['GET'])
 def get_categories() -> Response:
     """Get all categories with game count"""
-    categories = db.session.query(Category).all()
-    categories_list = [category.to_dict() for category in categories]
+    categories = get_game_stats_query(Category, Game.category_id).order_by(Category.id).all()
+    categories_list = [category.to_dict(game_count=game_count) for category, game_count, _ in categories]
     return jsonify(categories_list)
+
+@publishers_bp.route('/api/categories/<int:id>', methods=['GET'])
+def get_category(id: int) -> tuple[Response, int] | Response:
+    """Get a category with game stats and a paginated list of its games"""
+    category = get_details_with_games(Category, Game.category_id, id)
+    
+    # Return 404 if category not found
+    if not category:
+        return jsonify({"error": "Category not found"}), 404
+    
+    return jsonify(category)
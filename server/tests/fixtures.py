@@ -0,0 +1,159 @@
+import atexit
+import json
+import sqlite3
+import unittest
+from typing import Dict, List, Any
+from flask import Flask, Blueprint
+from sqlalchemy import insert
+from models import Game, Publisher, Category, db, init_db
+
+# Seeded template databases shared by every test in the session, keyed by fixture data
+_TEMPLATES: Dict[str, sqlite3.Connection] = {}
+
+@atexit.register
+def _close_templates() -> None:
+    """Close the template databases when the test session exits"""
+    for template in _TEMPLATES.values():
+        template.close()
+    _TEMPLATES.clear()
+
+class DatabaseTestCase(unittest.TestCase):
+    """Base class for tests which need a seeded in-memory database
+
+    The database is created and seeded once per test session for each distinct
+    combination of TEST_DATA and SYNTHETIC_GAME_COUNT. Each test then starts
+    from a fresh copy of that template, restored with the sqlite3 backup API,
+    so tests remain isolated without rebuilding the schema or reseeding.
+
+    Most of the remaining run time is per-class app setup and the test requests.
+    """
+    # Blueprints to register on the test app
+    BLUEPRINTS: List[Blueprint] = []
+
+    # Test data, in the same shape used by the individual test modules
+    TEST_DATA: Dict[str, Any] = {}
+
+    # Number of additional generated games to seed for performance tests
+    SYNTHETIC_GAME_COUNT: int = 0
+
+    # Database for the test app; override with a file database for tests which need one
+    DATABASE_URI: str = 'sqlite:///:memory:'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the test app and load the template database for the class"""
+        # Create a Flask app for testing, shared by all tests in the class
+        cls.app = Flask(__name__)
+        cls.app.config['TESTING'] = True
+        cls.app.config['SQLALCHEMY_DATABASE_URI'] = cls.DATABASE_URI
+        cls.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        for blueprint in cls.BLUEPRINTS:
+            cls.app.register_blueprint(blueprint)
+
+        # Initialize database for testing
+        init_db(cls.app, testing=True)
+
+        cls._template = cls._get_template()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Ensure proper connection closure"""
+        with cls.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    def setUp(self) -> None:
+        """Restore the seeded template into the test database"""
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            connection = db.engine.raw_connection()
+            try:
+                self._template.backup(connection.driver_connection)
+            finally:
+                connection.close()
+
+    def tearDown(self) -> None:
+        """Discard the session so the next test starts from the template"""
+        with self.app.app_context():
+            db.session.remove()
+
+    @classmethod
+    def _get_template(cls) -> sqlite3.Connection:
+        """Return the template database for this class, building it on first use"""
+        key = json.dumps(
+            {"data": cls.TEST_DATA, "synthetic_games": cls.SYNTHETIC_GAME_COUNT},
+            sort_keys=True
+        )
+        if key not in _TEMPLATES:
+            with cls.app.app_context():
+                cls._seed_test_data()
+                if cls.SYNTHETIC_GAME_COUNT:
+                    cls._seed_synthetic_games(cls.SYNTHETIC_GAME_COUNT)
+                db.session.remove()
+
+                # In-memory SQLite uses a single static connection, so this is
+                # the same database the routes will query
+                template = sqlite3.connect(':memory:', check_same_thread=False)
+                connection = db.engine.raw_connection()
+                try:
+                    connection.driver_connection.backup(template)
+                finally:
+                    connection.close()
+            _TEMPLATES[key] = template
+        return _TEMPLATES[key]
+
+    @classmethod
+    def _seed_test_data(cls) -> None:
+        """Helper method to seed TEST_DATA through the models"""
+        # Create test publishers
+        publishers = [
+            Publisher(**publisher_data) for publisher_data in cls.TEST_DATA.get("publishers", [])
+        ]
+        db.session.add_all(publishers)
+
+        # Create test categories
+        categories = [
+            Category(**category_data) for category_data in cls.TEST_DATA.get("categories", [])
+        ]
+        db.session.add_all(categories)
+
+        # Commit to get IDs
+        db.session.commit()
+
+        # Create test games
+        games = []
+        for game_data in cls.TEST_DATA.get("games", []):
+            game_dict = game_data.copy()
+            publisher_index = game_dict.pop("publisher_index")
+            category_index = game_dict.pop("category_index")
+
+            games.append(Game(
+                **game_dict,
+                publisher=publishers[publisher_index],
+                category=categories[category_index]
+            ))
+
+        db.session.add_all(games)
+        db.session.commit()
+
+    @classmethod
+    def _seed_synthetic_games(cls, count: int) -> None:
+        """Helper method to bulk insert generated games across the seeded publishers and categories"""
+        publisher_ids = [publisher.id for publisher in db.session.query(Publisher.id).order_by(Publisher.id)]
+        category_ids = [category.id for category in db.session.query(Category.id).order_by(Category.id)]
+        if not publisher_ids or not category_ids:
+            raise ValueError("Synthetic games require at least one publisher and one category")
+
+        rows = [
+            {
+                "title": f"Synthetic Game {i}",
+                "description": f"Generated game number {i} for performance testing",
+                "publisher_id": publisher_ids[i % len(publisher_ids)],
+                "category_id": category_ids[i % len(category_ids)],
+                "star_rating": round(3.0 + (i % 21) / 10, 1)
+            }
+            for i in range(count)
+        ]
+        db.session.execute(insert(Game), rows)
+        db.session.commit()
@@ -0,0 +1,78 @@
+import unittest
+import json
+from typing import Dict, Any
+from flask import Response
+from models import Game, Publisher, db
+from routes.games import games_bp
+from tests.fixtures import DatabaseTestCase
+
+class TestDatabaseFixture(DatabaseTestCase):
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {
+                "title": "Pipeline Panic",
+                "description": "Build your DevOps pipeline before chaos ensues",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 4.5
+            }
+        ]
+    }
+
+    # Generated games added on top of TEST_DATA
+    SYNTHETIC_GAME_COUNT: int = 500
+
+    # Blueprints under test
+    BLUEPRINTS = [games_bp]
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def test_synthetic_catalog_seeded(self) -> None:
+        """Test the synthetic games are seeded alongside the test data"""
+        # Act
+        response = self.client.get(self.GAMES_API_PATH)
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data), len(self.TEST_DATA["games"]) + self.SYNTHETIC_GAME_COUNT)
+
+        publisher_ids = {game['publisher']['id'] for game in data}
+        self.assertEqual(len(publisher_ids), len(self.TEST_DATA["publishers"]))
+
+    def test_changes_do_not_persist_a(self) -> None:
+        """Test changes made in one test are not visible to the next (first half)"""
+        self._assert_template_state_and_modify()
+
+    def test_changes_do_not_persist_b(self) -> None:
+        """Test changes made in one test are not visible to the next (second half)"""
+        self._assert_template_state_and_modify()
+
+    def _assert_template_state_and_modify(self) -> None:
+        """Helper method to check the database matches the template, then change it"""
+        with self.app.app_context():
+            # Assert
+            self.assertEqual(db.session.query(Game).count(), len(self.TEST_DATA["games"]) + self.SYNTHETIC_GAME_COUNT)
+            self.assertEqual(db.session.query(Publisher).count(), len(self.TEST_DATA["publishers"]))
+
+            # Act - modify the database for the following test
+            db.session.query(Game).delete()
+            db.session.add(Publisher(name="Temporary Publisher"))
+            db.session.commit()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,11 @@
 import unittest
 import json
 from typing import Dict, List, Any, Optional
-from flask import Flask, Response
-from models import Game, Publisher, Category, db, init_db
+from flask import Response
 from routes.games import games_bp
+from tests.fixtures import DatabaseTestCase
 
-class TestGamesRoutes(unittest.TestCase):
+class TestGamesRoutes(DatabaseTestCase):
     # Test data as complete objects
     TEST_DATA: Dict[str, Any] = {
         "publishers": [
@@ -34,71 +34,12 @@ class TestGamesRoutes(unittest.TestCase):
         ]
     }
     
+    # Blueprints under test
+    BLUEPRINTS = [games_bp]
+
     # API paths
     GAMES_API_PATH: str = '/api/games'
 
-    def setUp(self) -> None:
-        """Set up test database and seed data"""
-        # Create a fresh Flask app for testing
-        self.app = Flask(__name__)
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        
-        # Register the games blueprint
-        self.app.register_blueprint(games_bp)
-        
-        # Initialize the test client
-        self.client = self.app.test_client()
-        
-        # Initialize in-memory database for testing
-        init_db(self.app, testing=True)
-        
-        # Create tables and seed data
-        with self.app.app_context():
-            db.create_all()
-            self._seed_test_data()
-
-    def tearDown(self) -> None:
-        """Clean up test database and ensure proper connection closure"""
-        with self.app.app_context():
-            db.session.remove()
-            db.drop_all()
-            db.engine.dispose()
-
-    def _seed_test_data(self) -> None:
-        """Helper method to seed test data"""
-        # Create test publishers
-        publishers = [
-            Publisher(**publisher_data) for publisher_data in self.TEST_DATA["publishers"]
-        ]
-        db.session.add_all(publishers)
-        
-        # Create test categories
-        categories = [
-            Category(**category_data) for category_data in self.TEST_DATA["categories"]
-        ]
-        db.session.add_all(categories)
-        
-        # Commit to get IDs
-        db.session.commit()
-        
-        # Create test games
-        games = []
-        for game_data in self.TEST_DATA["games"]:
-            game_dict = game_data.copy()
-            publisher_index = game_dict.pop("publisher_index")
-            category_index = game_dict.pop("category_index")
-            
-            games.append(Game(
-                **game_dict,
-                publisher=publishers[publisher_index],
-                category=categories[category_index]
-            ))
-            
-        db.session.add_all(games)
-        db.session.commit()
-
     def _get_response_data(self, response: Response) -> Any:
         """Helper method to parse response data"""
         return json.loads(response.data)
@@ -1,11 +1,11 @@
 import unittest
 import json
 from typing import Dict, List, Any
-from flask import Flask, Response
-from models import Game, Publisher, Category, db, init_db
+from flask import Response
 from routes.publishers import publishers_bp
+from tests.fixtures import DatabaseTestCase
 
-class TestPublishersRoutes(unittest.TestCase):
+class TestPublishersRoutes(DatabaseTestCase):
     # Test data
     TEST_DATA: Dict[str, Any] = {
         "publishers": [
@@ -15,55 +15,35 @@ class TestPublishersRoutes(unittest.TestCase):
         "categories": [
             {"name": "Strategy", "description": "Strategic thinking games"},
             {"name": "Card Game", "description": "Card-based gaming"}
+        ],
+        "games": [
+            {
+                "title": "Pipeline Panic",
+                "description": "Build your DevOps pipeline before chaos ensues",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 4.5
+            },
+            {
+                "title": "Merge Conflict",
+                "description": "Resolve conflicts before the release train leaves",
+                "publisher_index": 0,
+                "category_index": 1,
+                "star_rating": 3.5
+            },
+            {
+                "title": "Agile Adventures",
+                "description": "Navigate your team through sprints and releases",
+                "publisher_index": 1,
+                "category_index": 0,
+                "star_rating": 4.2
+            }
         ]
     }
-    
-    def setUp(self) -> None:
-        """Set up test database and seed data"""
-        # Create a fresh Flask app for testing
-        self.app = Flask(__name__)
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        
-        # Register the publishers blueprint
-        self.app.register_blueprint(publishers_bp)
-        
-        # Initialize the test client
-        self.client = self.app.test_client()
-        
-        # Initialize in-memory database for testing
-        init_db(self.app, testing=True)
-        
-        # Create tables and seed data
-        with self.app.app_context():
-            db.create_all()
-            self._seed_test_data()
-
-    def tearDown(self) -> None:
-        """Clean up test database and ensure proper connection closure"""
-        with self.app.app_context():
-            db.session.remove()
-            db.drop_all()
-            db.engine.dispose()
-
-    def _seed_test_data(self) -> None:
-        """Helper method to seed test data"""
-        # Create test publishers
-        publishers = [
-            Publisher(**publisher_data) for publisher_data in self.TEST_DATA["publishers"]
-        ]
-        db.session.add_all(publishers)
-        
-        # Create test categories
-        categories = [
-            Category(**category_data) for category_data in self.TEST_DATA["categories"]
-        ]
-        db.session.add_all(categories)
-        
-        # Commit changes
-        db.session.commit()
 
+    # Blueprints under test
+    BLUEPRINTS = [publishers_bp]
+    
     def _get_response_data(self, response: Response) -> Any:
         """Helper method to parse response data"""
         return json.loads(response.data)
@@ -83,7 +63,8 @@ class TestPublishersRoutes(unittest.TestCase):
             test_publisher = self.TEST_DATA["publishers"][i]
             self.assertEqual(publisher_data['name'], test_publisher["name"])
             self.assertEqual(publisher_data['description'], test_publisher["description"])
-            self.assertIn('game_count', publisher_data)
+            expected_count = len([game for game in self.TEST_DATA["games"] if game["publisher_index"] == i])
+            self.assertEqual(publisher_data['game_count'], expected_count)
 
     def test_get_categories_success(self) -> None:
         """Test successful retrieval of categories"""
@@ -100,7 +81,112 @@ class TestPublishersRoutes(unittest.TestCase):
             test_category = self.TEST_DATA["categories"][i]
             self.assertEqual(category_data['name'], test_category["name"])
             self.assertEqual(category_data['description'], test_category["description"])
-            self.assertIn('game_count', category_data)
+            expected_count = len([game for game in self.TEST_DATA["games"] if game["category_index"] == i])
+            self.assertEqual(category_data['game_count'], expected_count)
+
+    def _get_first_id(self, path: str) -> int:
+        """Helper method to get the ID of the first item from a list endpoint"""
+        response = self.client.get(path)
+        return self._get_response_data(response)[0]['id']
+
+    def test_get_publisher_by_id_success(self) -> None:
+        """Test successful retrieval of a single publisher with stats and games"""
+        publisher_id = self._get_first_id('/api/publishers')
+
+        # Act
+        response = self.client.get(f'/api/publishers/{publisher_id}')
+        data = self._get_response_data(response)
+
+        # Assert
+        test_publisher = self.TEST_DATA["publishers"][0]
+        test_games = [game for game in self.TEST_DATA["games"] if game["publisher_index"] == 0]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['name'], test_publisher["name"])
+        self.assertEqual(data['description'], test_publisher["description"])
+        self.assertEqual(data['game_count'], len(test_games))
+        self.assertEqual(data['average_star_rating'], 4.0)
+        self.assertEqual([game['title'] for game in data['games']], [game["title"] for game in test_games])
+        self.assertIsNone(data['next_after'])
+        for game in data['games']:
+            self.assertEqual(game['publisher']['id'], publisher_id)
+
+    def test_get_publisher_by_id_paginated(self) -> None:
+        """Test paging through a publisher's games"""
+        publisher_id = self._get_first_id('/api/publishers')
+
+        # Act - get the first page
+        response = self.client.get(f'/api/publishers/{publisher_id}?limit=1')
+        first_page = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(first_page['games']), 1)
+        self.assertEqual(first_page['next_after'], first_page['games'][0]['id'])
+
+        # Act - get the next page
+        response = self.client.get(f'/api/publishers/{publisher_id}?limit=1&after={first_page["next_after"]}')
+        second_page = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(second_page['games']), 1)
+        self.assertGreater(second_page['games'][0]['id'], first_page['games'][0]['id'])
+        self.assertIsNone(second_page['next_after'])
+        self.assertEqual(second_page['game_count'], first_page['game_count'])
+
+    def test_get_publisher_by_id_invalid_limit(self) -> None:
+        """Test an invalid page size falls back to the default"""
+        publisher_id = self._get_first_id('/api/publishers')
+
+        # Act
+        response = self.client.get(f'/api/publishers/{publisher_id}?limit=invalid')
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), data['game_count'])
+
+    def test_get_publisher_by_id_not_found(self) -> None:
+        """Test retrieval of a non-existent publisher by ID"""
+        # Act
+        response = self.client.get('/api/publishers/999')
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(data['error'], "Publisher not found")
+
+    def test_get_category_by_id_success(self) -> None:
+        """Test successful retrieval of a single category with stats and games"""
+        category_id = self._get_first_id('/api/categories')
+
+        # Act
+        response = self.client.get(f'/api/categories/{category_id}')
+        data = self._get_response_data(response)
+
+        # Assert
+        test_category = self.TEST_DATA["categories"][0]
+        test_games = [game for game in self.TEST_DATA["games"] if game["category_index"] == 0]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['name'], test_category["name"])
+        self.assertEqual(data['game_count'], len(test_games))
+        self.assertEqual(data['average_star_rating'], 4.35)
+        self.assertEqual([game['title'] for game in data['games']], [game["title"] for game in test_games])
+        self.assertIsNone(data['next_after'])
+        for game in data['games']:
+            self.assertEqual(game['category']['id'], category_id)
+
+    def test_get_category_by_id_not_found(self) -> None:
+        """Test retrieval of a non-existent category by ID"""
+        # Act
+        response = self.client.get('/api/categories/999')
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(data['error'], "Category not found")
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
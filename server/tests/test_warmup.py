@@ -0,0 +1,278 @@
+import unittest
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Any
+from unittest.mock import patch
+from flask import Response
+from models import Game, Publisher, Category, db
+from routes.games import games_bp
+from routes.publishers import publishers_bp
+from routes.health import health_bp
+from utils.warmup import WARMUP_EXTENSION, WarmupState, init_warmup, run_warmup, get_warmup_requests
+from tests.fixtures import DatabaseTestCase
+
+class TestWarmup(DatabaseTestCase):
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {
+                "title": "Pipeline Panic",
+                "description": "Build your DevOps pipeline before chaos ensues",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 4.5
+            },
+            {
+                "title": "Agile Adventures",
+                "description": "Navigate your team through sprints and releases",
+                "publisher_index": 1,
+                "category_index": 1,
+                "star_rating": 4.2
+            }
+        ]
+    }
+
+    # Blueprints under test
+    BLUEPRINTS = [games_bp, publishers_bp, health_bp]
+
+    # Use a file database, since precomputed responses are checked against the database file
+    DATABASE_URI: str = ''
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    READY_API_PATH: str = '/api/ready'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create a temporary file database for the test app"""
+        cls.database_dir = tempfile.mkdtemp()
+        cls.DATABASE_URI = f"sqlite:///{os.path.join(cls.database_dir, 'test.db')}"
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the temporary file database"""
+        super().tearDownClass()
+        shutil.rmtree(cls.database_dir)
+
+    def setUp(self) -> None:
+        """Restore the database and reset the warmup state"""
+        super().setUp()
+        init_warmup(self.app, autostart=False)
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _get_state(self) -> WarmupState:
+        """Helper method to get the app's warmup state"""
+        return self.app.extensions[WARMUP_EXTENSION]
+
+    def _add_game(self) -> str:
+        """Helper method to add a game after warmup, returning its title"""
+        title = "Release Rush"
+        with self.app.app_context():
+            db.session.add(Game(
+                title=title,
+                description="Ship the release before the deadline hits",
+                publisher=db.session.query(Publisher).first(),
+                category=db.session.query(Category).first(),
+                star_rating=3.9
+            ))
+            db.session.commit()
+        return title
+
+    def _patch_routes_to_fail(self) -> Any:
+        """Helper method to make the listing routes fail, so only precomputed responses succeed"""
+        return patch('routes.games.get_games_base_query', side_effect=RuntimeError("Route should not run"))
+
+    def test_ready_before_warmup(self) -> None:
+        """Test readiness reports unavailable until warmup has finished"""
+        # Act
+        response = self.client.get(self.READY_API_PATH)
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(data['status'], "warming up")
+
+    def test_ready_after_warmup(self) -> None:
+        """Test readiness reports ready once warmup has finished"""
+        # Act
+        run_warmup(self.app)
+        response = self.client.get(self.READY_API_PATH)
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], "ready")
+
+    def test_warmup_starts_on_first_request(self) -> None:
+        """Test warmup starts in the background on the first request when autostart is enabled"""
+        # Arrange
+        init_warmup(self.app)
+
+        # Act
+        self.client.get(self.READY_API_PATH)
+        self._get_state().thread.join()
+        response = self.client.get(self.READY_API_PATH)
+
+        # Assert
+        self.assertEqual(self._get_state().pid, os.getpid())
+        self.assertEqual(response.status_code, 200)
+
+    def test_warmup_requests_cover_listings(self) -> None:
+        """Test warmup covers the unfiltered listings and every category and publisher filter"""
+        # Arrange
+        category_ids = [category['id'] for category in self._get_response_data(self.client.get('/api/categories'))]
+        publisher_ids = [publisher['id'] for publisher in self._get_response_data(self.client.get('/api/publishers'))]
+
+        # Act
+        warmup_requests = get_warmup_requests(self.app)
+
+        # Assert
+        expected = [
+            (self.GAMES_API_PATH, {}),
+            ('/api/publishers', {}),
+            ('/api/categories', {})
+        ]
+        expected += [(self.GAMES_API_PATH, {'category_id': str(category_id)}) for category_id in category_ids]
+        expected += [(self.GAMES_API_PATH, {'publisher_id': str(publisher_id)}) for publisher_id in publisher_ids]
+        self.assertCountEqual(warmup_requests, expected)
+        self.assertEqual(len(category_ids), len(self.TEST_DATA["categories"]))
+        self.assertEqual(len(publisher_ids), len(self.TEST_DATA["publishers"]))
+
+    def test_warmup_failure_still_ready(self) -> None:
+        """Test a listing which fails during warmup is skipped and the app still becomes ready"""
+        # Act
+        with patch('routes.publishers.get_game_stats_query', side_effect=RuntimeError("Warmup failure")):
+            with self.assertLogs(self.app.logger, level='ERROR'):
+                run_warmup(self.app)
+        response = self.client.get(self.READY_API_PATH)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('/api/publishers?', self._get_state().responses)
+        self.assertIn('/api/games?', self._get_state().responses)
+
+    def test_precomputed_listings_served(self) -> None:
+        """Test listings are served from the responses precomputed at warmup"""
+        # Arrange
+        expected = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        category_id = expected[0]['category']['id']
+        run_warmup(self.app)
+
+        # Act - the routes fail, so a successful response must be precomputed
+        with self._patch_routes_to_fail():
+            response = self.client.get(self.GAMES_API_PATH)
+            filtered_response = self.client.get(f'{self.GAMES_API_PATH}?category_id={category_id}')
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_response_data(response), expected)
+        self.assertEqual(filtered_response.status_code, 200)
+        self.assertEqual([game['title'] for game in self._get_response_data(filtered_response)], [expected[0]['title']])
+
+    def test_precomputed_response_compressed(self) -> None:
+        """Test gzip compressed responses are served to clients which accept them"""
+        # Arrange
+        expected = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        run_warmup(self.app)
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.data)), expected)
+
+    def test_precomputed_response_rebuilt_after_change(self) -> None:
+        """Test a change to the database is served, and the precomputed response is rebuilt"""
+        # Arrange
+        run_warmup(self.app)
+        title = self._add_game()
+
+        # Act - the first request after the change goes to the route
+        response = self.client.get(self.GAMES_API_PATH)
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(len(data), len(self.TEST_DATA["games"]) + 1)
+        self.assertIn(title, [game['title'] for game in data])
+
+        # Act - later requests are served from the rebuilt response
+        with self._patch_routes_to_fail():
+            response = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.data)), data)
+
+    def test_filtered_listing_reflects_change(self) -> None:
+        """Test a change to the database shows up in the filtered listings and counts"""
+        # Arrange
+        run_warmup(self.app)
+        title = self._add_game()
+        games = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        category_id = next(game['category']['id'] for game in games if game['title'] == title)
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?category_id={category_id}')
+        filtered_games = self._get_response_data(response)
+        categories = self._get_response_data(self.client.get('/api/categories'))
+
+        # Assert
+        self.assertIn(title, [game['title'] for game in filtered_games])
+        category = next(category for category in categories if category['id'] == category_id)
+        self.assertEqual(category['game_count'], len(filtered_games))
+
+    def test_listings_populated_after_warmup_on_empty_database(self) -> None:
+        """Test an app warmed up before seeding serves the seeded data"""
+        # Arrange - remove the games, warm up, then add a game
+        with self.app.app_context():
+            db.session.query(Game).delete()
+            db.session.commit()
+        run_warmup(self.app)
+        self.assertEqual(self._get_response_data(self.client.get(self.GAMES_API_PATH)), [])
+        title = self._add_game()
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH)
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data], [title])
+
+    def test_uncached_request_uses_route(self) -> None:
+        """Test requests without a precomputed response go to the routes"""
+        # Arrange
+        run_warmup(self.app)
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?category_id=999')
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data), 0)
+        self.assertNotIn('Content-Encoding', response.headers)
+
+if __name__ == '__main__':
+    unittest.main()
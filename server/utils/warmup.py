@@ -0,0 +1,191 @@
+import gzip
+import os
+import threading
+from typing import Optional
+from urllib.parse import urlencode
+from flask import Flask, Response, current_app, g, request
+from sqlalchemy.engine import make_url
+from models import db, Category, Publisher
+
+# Key for the warmup state in app.extensions
+WARMUP_EXTENSION: str = 'warmup'
+
+# File change counter from the database header, then the modification time and size of the
+# database file and its WAL and rollback journal files
+DataVersion = tuple[Optional[bytes | tuple[int, int]], ...]
+
+# Guards starting warmup so concurrent first requests only start it once
+_start_lock = threading.Lock()
+
+class WarmupState:
+    """Precomputed listing responses and whether warmup has finished in this process"""
+
+    def __init__(self, compress: bool, autostart: bool) -> None:
+        self.compress: bool = compress
+        self.autostart: bool = autostart
+        self.ready: threading.Event = threading.Event()
+        # Process the warmup was started in; a forked worker gets its own warmup
+        self.pid: Optional[int] = None
+        self.thread: Optional[threading.Thread] = None
+        # Cache key -> data version the bodies were built from, and {content encoding: body}
+        # where 'identity' is the uncompressed body
+        self.responses: dict[str, tuple[DataVersion, dict[str, bytes]]] = {}
+
+def init_warmup(app: Flask, compress: bool = True, autostart: bool = True) -> None:
+    """Set up warmup and serving of precomputed listing responses for the app
+
+    Args:
+        app: The Flask application instance
+        compress: If True, also precompute gzip compressed bodies for clients which accept them
+        autostart: If True, start warmup in the background on the first request in each process
+    """
+    # Only register the hooks once, so calling again just resets the state
+    if WARMUP_EXTENSION not in app.extensions:
+        app.before_request(_serve_precomputed_response)
+        app.after_request(_store_route_response)
+    app.extensions[WARMUP_EXTENSION] = WarmupState(compress, autostart)
+
+def start_warmup(app: Flask) -> Optional[threading.Thread]:
+    """Start warmup in a background thread, unless it has already been started in this process"""
+    with _start_lock:
+        state: WarmupState = app.extensions[WARMUP_EXTENSION]
+        if state.pid == os.getpid():
+            return None
+
+        if state.pid is not None:
+            # Forked from a process which had already started warmup; threads are not
+            # copied into the fork, so start again with fresh state
+            state = WarmupState(state.compress, state.autostart)
+            app.extensions[WARMUP_EXTENSION] = state
+
+        state.pid = os.getpid()
+        state.thread = threading.Thread(target=run_warmup, args=(app,), name='warmup', daemon=True)
+        state.thread.start()
+        return state.thread
+
+def run_warmup(app: Flask) -> None:
+    """Precompute the unfiltered and per-filter listing responses, then mark the app ready"""
+    state: WarmupState = app.extensions[WARMUP_EXTENSION]
+    state.pid = os.getpid()
+    try:
+        client = app.test_client()
+        for path, params in get_warmup_requests(app):
+            try:
+                # Read the version first, so changes made while the route runs invalidate the body
+                version = get_data_version(app)
+                # Requests go through the routes, which also warms the SQLite page cache and ORM
+                response = client.get(path, query_string=params)
+                if response.status_code == 200 and version is not None:
+                    _store_body(state, _get_cache_key(path, params), version, response.get_data())
+            except Exception:
+                # Listings without a precomputed response are still served by the routes
+                app.logger.exception("Cache warmup failed for %s %s", path, params)
+    except Exception:
+        app.logger.exception("Cache warmup failed")
+    finally:
+        state.ready.set()
+
+def get_warmup_requests(app: Flask) -> list[tuple[str, dict[str, str]]]:
+    """Get the listing requests to precompute, as path and query string parameters"""
+    with app.app_context():
+        category_ids = [category.id for category in db.session.query(Category.id).order_by(Category.id)]
+        publisher_ids = [publisher.id for publisher in db.session.query(Publisher.id).order_by(Publisher.id)]
+        db.session.remove()
+
+    warmup_requests = [
+        ('/api/games', {}),
+        ('/api/publishers', {}),
+        ('/api/categories', {})
+    ]
+    warmup_requests += [('/api/games', {'category_id': str(category_id)}) for category_id in category_ids]
+    warmup_requests += [('/api/games', {'publisher_id': str(publisher_id)}) for publisher_id in publisher_ids]
+    return warmup_requests
+
+def get_data_version(app: Flask) -> Optional[DataVersion]:
+    """Get a cheap signal which changes whenever the SQLite database is written
+
+    Writes from any process, such as utils/seed_database.py, bump the file change counter
+    in the database header, and change the modification time or size of the database file
+    or its WAL or journal file. Returns None when there is no database file to check,
+    such as an in-memory database.
+    """
+    database = make_url(app.config['SQLALCHEMY_DATABASE_URI']).database
+    if not database or database == ':memory:' or not os.path.exists(database):
+        return None
+
+    # The file change counter is bytes 24-27 of the database header
+    with open(database, 'rb') as database_file:
+        version: list[Optional[bytes | tuple[int, int]]] = [database_file.read(28)[24:]]
+
+    for path in (database, f'{database}-wal', f'{database}-journal'):
+        try:
+            stat = os.stat(path)
+            version.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            version.append(None)
+    return tuple(version)
+
+def is_ready(app: Flask) -> bool:
+    """Check if warmup has finished; apps without warmup are always ready"""
+    state: Optional[WarmupState] = app.extensions.get(WARMUP_EXTENSION)
+    return state is None or state.ready.is_set()
+
+def _store_body(state: WarmupState, key: str, version: DataVersion, body: bytes) -> None:
+    """Store a listing body, and a compressed copy if enabled, for the given data version"""
+    bodies = {'identity': body}
+    if state.compress:
+        bodies['gzip'] = gzip.compress(body)
+    state.responses[key] = (version, bodies)
+
+def _get_cache_key(path: str, params: dict[str, str]) -> str:
+    """Build a cache key which matches regardless of query string parameter order"""
+    return f"{path}?{urlencode(sorted(params.items()))}"
+
+def _serve_precomputed_response() -> Optional[Response]:
+    """Return the precomputed response for the request if the database has not changed since it was built"""
+    state: WarmupState = current_app.extensions[WARMUP_EXTENSION]
+    if state.autostart and state.pid != os.getpid():
+        # The warmup thread outlives the request, so it needs the app rather than the proxy
+        start_warmup(current_app._get_current_object())
+        state = current_app.extensions[WARMUP_EXTENSION]
+
+    if request.method != 'GET':
+        return None
+
+    # Routes read the first value of each parameter, so match on the same
+    key = _get_cache_key(request.path, request.args.to_dict())
+    precomputed = state.responses.get(key)
+    if precomputed is None:
+        return None
+
+    version = get_data_version(current_app)
+    stored_version, bodies = precomputed
+    if version is None or version != stored_version:
+        # Let the route build a fresh response, then store it for the following requests
+        g.warmup_rebuild = (key, version)
+        return None
+
+    if 'gzip' in bodies and request.accept_encodings['gzip']:
+        response = Response(bodies['gzip'], mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(bodies['identity'], mimetype='application/json')
+
+    if state.compress:
+        response.vary.add('Accept-Encoding')
+    return response
+
+def _store_route_response(response: Response) -> Response:
+    """Rebuild a stale precomputed response from the route's response"""
+    rebuild: Optional[tuple[str, Optional[DataVersion]]] = g.pop('warmup_rebuild', None)
+    if rebuild is None:
+        return response
+
+    state: WarmupState = current_app.extensions[WARMUP_EXTENSION]
+    key, version = rebuild
+    if response.status_code == 200 and version is not None:
+        _store_body(state, key, version, response.get_data())
+
+    if state.compress:
+        response.vary.add('Accept-Encoding')
+    return response